@@ -1,14 +1,19 @@
 # infrastructure/observability/activities/log/create_grafana_datasource_activity.py
+import asyncio
 import json
 import logging
 import urllib.request
 import urllib.error
 import base64
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from temporalio import activity
 
 logger = logging.getLogger(__name__)
 
+def _send(req: urllib.request.Request, timeout: float) -> Tuple[int, str]:
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read().decode("utf-8")
+
 @activity.defn
 async def create_grafana_datasource_activity(params: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("create_grafana_datasource_activity started")
@@ -37,10 +42,9 @@ async def create_grafana_datasource_activity(params: Dict[str, Any]) -> Dict[str
         name_endpoint = grafana_url.rstrip("/") + f"/api/datasources/name/{urllib.request.quote(datasource_name)}"
         req = urllib.request.Request(name_endpoint, headers=headers, method="GET")
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                body = resp.read().decode("utf-8")
-                existing = json.loads(body) if body else {}
-                ds_id = existing.get("id")
+            _, body = await asyncio.to_thread(_send, req, 10)
+            existing = json.loads(body) if body else {}
+            ds_id = existing.get("id")
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 ds_id = None
@@ -56,10 +60,9 @@ async def create_grafana_datasource_activity(params: Dict[str, Any]) -> Dict[str
             payload = json.dumps({**ds_def, "id": ds_id}).encode("utf-8")
             put_req = urllib.request.Request(update_endpoint, data=payload, headers=headers, method="PUT")
             try:
-                with urllib.request.urlopen(put_req, timeout=10) as resp2:
-                    body2 = resp2.read().decode("utf-8")
-                    logger.info("grafana_datasource_updated id=%s", ds_id)
-                    return {"success": True, "data": {"status": resp2.status, "body": body2, "id": ds_id}, "error": None}
+                status2, body2 = await asyncio.to_thread(_send, put_req, 10)
+                logger.info("grafana_datasource_updated id=%s", ds_id)
+                return {"success": True, "data": {"status": status2, "body": body2, "id": ds_id}, "error": None}
             except urllib.error.HTTPError as e2:
                 try:
                     err_body2 = e2.read().decode("utf-8")
@@ -72,10 +75,9 @@ async def create_grafana_datasource_activity(params: Dict[str, Any]) -> Dict[str
             payload = json.dumps(ds_def).encode("utf-8")
             post_req = urllib.request.Request(create_endpoint, data=payload, headers=headers, method="POST")
             try:
-                with urllib.request.urlopen(post_req, timeout=10) as resp3:
-                    body3 = resp3.read().decode("utf-8")
-                    logger.info("grafana_datasource_created")
-                    return {"success": True, "data": {"status": resp3.status, "body": body3}, "error": None}
+                status3, body3 = await asyncio.to_thread(_send, post_req, 10)
+                logger.info("grafana_datasource_created")
+                return {"success": True, "data": {"status": status3, "body": body3}, "error": None}
             except urllib.error.HTTPError as e3:
                 try:
                     err_body3 = e3.read().decode("utf-8")
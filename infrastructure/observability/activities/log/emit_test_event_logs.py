@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 import uuid
@@ -89,7 +90,7 @@ async def emit_test_event_logs(params: Dict[str, Any]) -> Dict[str, Any]:
                         except Exception as e:
                             logger.error("append_host_failed %s: %s", fp, str(e))
 
-        time.sleep(wait_ms / 1000)
+        await asyncio.sleep(wait_ms / 1000)
 
         return {
             "success": True,
@@ -1,13 +1,18 @@
 # infrastructure/observability/activities/log/exporters/loki_exporter_activity.py
+import asyncio
 import json
 import logging
 import urllib.request
 import urllib.error
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 from temporalio import activity
 
 logger = logging.getLogger(__name__)
 
+def _send(req: urllib.request.Request, timeout: float) -> Tuple[int, str]:
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read().decode("utf-8")
+
 @activity.defn
 async def loki_exporter_activity(params: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("loki_exporter_activity started with params: %s", params)
@@ -32,10 +37,9 @@ async def loki_exporter_activity(params: Dict[str, Any]) -> Dict[str, Any]:
     req = urllib.request.Request(url.rstrip("/") + "/loki/api/v1/push", data=body, headers={"Content-Type": "application/json"})
     try:
         logger.info("sending logs to loki at %s", url)
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            resp_body = resp.read().decode("utf-8")
-            logger.info("loki_exporter_activity success: status=%s", resp.status)
-            return {"success": True, "data": {"status": resp.status, "body": resp_body}, "error": None}
+        status, resp_body = await asyncio.to_thread(_send, req, timeout)
+        logger.info("loki_exporter_activity success: status=%s", status)
+        return {"success": True, "data": {"status": status, "body": resp_body}, "error": None}
     except urllib.error.HTTPError as e:
         try:
             err_body = e.read().decode("utf-8")
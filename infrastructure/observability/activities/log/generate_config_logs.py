@@ -35,7 +35,11 @@ async def generate_config_logs(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     processors = {
-        "batch": {"timeout": "10s"}
+        "batch": {
+            "timeout": "1s",
+            "send_batch_size": 256,
+            "send_batch_max_size": 512
+        }
     }
 
     exporters = {
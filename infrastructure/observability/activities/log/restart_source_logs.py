@@ -1,4 +1,5 @@
 # infrastructure/observability/activities/log/restart_source_logs.py
+import asyncio
 import logging
 import time
 from typing import Dict, Any
@@ -45,8 +46,8 @@ async def restart_source_logs(params: Dict[str, Any]) -> Dict[str, Any]:
             except Exception as e:
                 logger.error("container_restart_failed: %s", str(e))
                 return {"success": False, "data": None, "error": "restart_failed"}
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < timeout_seconds:
             try:
                 container.reload()
                 status = container.status
@@ -60,7 +61,7 @@ async def restart_source_logs(params: Dict[str, Any]) -> Dict[str, Any]:
                 if health in (None, "healthy", "starting"):
                     logger.info("container_status_ok: %s", status)
                     return {"success": True, "data": {"status": status, "health": health}, "error": None}
-            time.sleep(1)
+            await asyncio.sleep(1)
         try:
             container.reload()
             final_status = container.status
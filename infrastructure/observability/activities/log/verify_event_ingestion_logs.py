@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from temporalio import activity
 import urllib.request
 import urllib.error
@@ -22,6 +23,11 @@ def _build_ready_url(loki_query_url: str) -> str:
         return loki_query_url[: -len("/query_range")] + "/ready"
     return loki_query_url.rstrip("/") + "/ready"
 
+def _http_get(url: str, timeout: float) -> Tuple[int, str]:
+    req = urllib.request.Request(url, method="GET")
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.getcode(), resp.read().decode("utf-8", errors="ignore")
+
 @activity.defn
 async def verify_event_ingestion_logs(params: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("verify_event_ingestion_logs started with params: %s", params)
@@ -44,13 +50,12 @@ async def verify_event_ingestion_logs(params: Dict[str, Any]) -> Dict[str, Any]:
 
     ready_url = _build_ready_url(loki_query_url)
 
-    start_time = time.time()
-    while time.time() - start_time < timeout_seconds:
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < timeout_seconds:
         try:
-            req = urllib.request.Request(ready_url, method="GET")
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                if resp.getcode() == 200:
-                    break
+            code, _ = await asyncio.to_thread(_http_get, ready_url, 5)
+            if code == 200:
+                break
         except urllib.error.HTTPError as e:
             try:
                 body = e.read().decode("utf-8", errors="ignore")
@@ -59,15 +64,15 @@ async def verify_event_ingestion_logs(params: Dict[str, Any]) -> Dict[str, Any]:
             logger.info("loki_ready_http_error code=%s body=%s", getattr(e, "code", None), body)
         except Exception as e:
             logger.info("loki_ready_error: %s", str(e))
-        time.sleep(1)
+        await asyncio.sleep(1)
     else:
         logger.error("loki_not_ready timeout")
         return {"success": False, "data": None, "error": "loki_not_ready"}
 
-    q_start = time.time()
+    q_start = time.perf_counter()
     tried_urls: List[str] = []
 
-    while time.time() - q_start < timeout_seconds:
+    while time.perf_counter() - q_start < timeout_seconds:
         try:
             query = urllib.parse.quote(logql, safe="")
 
@@ -89,13 +94,10 @@ async def verify_event_ingestion_logs(params: Dict[str, Any]) -> Dict[str, Any]:
 
             tried_urls.append(full)
 
-            req = urllib.request.Request(full, method="GET")
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                body = resp.read().decode("utf-8", errors="ignore")
-                code = resp.getcode()
-                if code == 200 and body:
-                    logger.info("verify_event_ingestion_logs matched: url=%s", full)
-                    return {"success": True, "data": {"url": full, "response": body}, "error": None}
+            code, body = await asyncio.to_thread(_http_get, full, 10)
+            if code == 200 and body:
+                logger.info("verify_event_ingestion_logs matched: url=%s", full)
+                return {"success": True, "data": {"url": full, "response": body}, "error": None}
 
         except urllib.error.HTTPError as e:
             try:
@@ -108,7 +110,7 @@ async def verify_event_ingestion_logs(params: Dict[str, Any]) -> Dict[str, Any]:
             last_err = e
             logger.info("loki_url_error: %s", str(e))
 
-        time.sleep(poll_interval)
+        await asyncio.sleep(poll_interval)
 
     logger.error(
         "verify_event_ingestion_logs timeout last_error=%s tried_urls=%s",
@@ -170,7 +170,7 @@ async def start_app_container(service_name: str) -> bool:
 
         except (DockerException, APIError) as e:
             logging.exception(f"Attempt {attempt + 1} failed: {e}")
-            time.sleep(CONFIG["retry_delay"])
+            await asyncio.sleep(CONFIG["retry_delay"])
 
     await _fetch_container_logs()
     logging.error("All attempts to start AI proxy failed")
@@ -200,7 +200,7 @@ async def stop_app_container(service_name: str) -> bool:
             return True
         except (DockerException, APIError) as e:
             logging.exception(f"Attempt {attempt + 1} to stop AI proxy failed: {e}")
-            time.sleep(CONFIG["retry_delay"])
+            await asyncio.sleep(CONFIG["retry_delay"])
     logging.error("All attempts to stop AI proxy failed")
     return False
 
@@ -258,18 +258,27 @@ async def _start_container_via_compose() -> None:
         raise RuntimeError(f"Failed to start container: {e}") from e
 
 
+def _health_endpoint_status() -> int:
+    """
+    Return the HTTP status of the container health endpoint.
+    """
+    import urllib.request
+
+    with urllib.request.urlopen(
+        CONFIG["health_endpoint"],
+        timeout=CONFIG["health_check_timeout"],
+    ) as response:
+        return response.status
+
+
 async def _check_container_health() -> bool:
     """
     Check if container health endpoint is responding.
     """
-    import urllib.request
+    import urllib.error
 
     try:
-        with urllib.request.urlopen(
-            CONFIG["health_endpoint"],
-            timeout=CONFIG["health_check_timeout"],
-        ) as response:
-            return response.status == 200
+        return await asyncio.to_thread(_health_endpoint_status) == 200
     except (urllib.error.URLError, OSError):
         return False
 
@@ -278,22 +287,16 @@ async def _wait_for_healthy_container(container) -> bool:
     """
     Wait for container to become healthy.
     """
-    import urllib.request
-
-    start_time = time.time()
-    while time.time() - start_time < CONFIG["max_wait_time"]:
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < CONFIG["max_wait_time"]:
         try:
             container.reload()
             if container.status != "running":
                 raise RuntimeError(f"Container stopped (status={container.status})")
 
-            with urllib.request.urlopen(
-                CONFIG["health_endpoint"],
-                timeout=CONFIG["health_check_timeout"],
-            ) as response:
-                if response.status == 200:
-                    logging.info("AI proxy health check passed!")
-                    return True
+            if await asyncio.to_thread(_health_endpoint_status) == 200:
+                logging.info("AI proxy health check passed!")
+                return True
         except Exception as e:
             logging.debug(f"Health check failed: {e}")
 
@@ -1,5 +1,5 @@
+import asyncio
 import logging
-import time
 from typing import Dict, Any
 from temporalio import activity
 from infrastructure.orchestrator.base.base_container_activity import BaseService, ContainerConfig
@@ -158,7 +158,7 @@ async def start_argocd_repo_server_activity(params: Dict[str, Any]) -> bool:
     manager.run()
     logger.info("ArgoCD Repository Server started successfully")
     # Wait for repo server to be ready
-    time.sleep(5)
+    await asyncio.sleep(5)
     return True
 
 
@@ -170,7 +170,7 @@ async def start_argocd_server_activity(params: Dict[str, Any]) -> bool:
     manager.run()
     logger.info("ArgoCD Server started successfully")
     # Wait for server to be ready
-    time.sleep(10)
+    await asyncio.sleep(10)
     return True
 
 
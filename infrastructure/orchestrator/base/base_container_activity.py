@@ -7,6 +7,7 @@ from enum import Enum
 import logging
 import time
 import concurrent.futures
+import functools
 import re
 
 # Avoid importing docker at module import time so this module can be safely imported
@@ -169,9 +170,10 @@ def _validate_and_normalize_volumes_in_run_args(run_args: Dict[str, Any]) -> Non
     run_args["volumes"] = normalized
 
 
+@functools.lru_cache(maxsize=None)
 def get_docker_client():
     """
-    Lazily import docker and return a Docker client instance.
+    Lazily import docker and return the process-wide Docker client instance.
     """
     # local import so module-level import of this module doesn't import docker
     import docker  # type: ignore
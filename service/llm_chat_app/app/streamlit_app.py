@@ -2,6 +2,7 @@ import sys
 import logging
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -13,6 +14,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from core.client.ai_client import get_ai_response
+from core.client.streaming_client import StreamingClient
 from core.models.knowledge_graph_store import (
     store_conversation_as_knowledge_graph,
     get_conversation_context,
@@ -22,8 +24,8 @@ from core.services.category_service import (
     get_models_for_category,
     get_default_model_for_category,
 )
-from core.services.intelligent_agent import IntelligentAgent
 from core.services.emotional_intelligence_engine import EmotionalIntelligenceEngine
+from core.services.enable_deep_analysis import analyze_deep_psychology
 from core.services.graph_visualization_service import GraphVisualizationService
 from ui_components import AuthUI, SidebarUI
 
@@ -32,6 +34,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_MAX_MESSAGES = 200
+_VISIBLE_MESSAGES = 20
+
 st.set_page_config(page_title="LLM Chat", page_icon="💬", layout="wide")
 
 if "authenticated" not in st.session_state:
@@ -98,7 +103,7 @@ def load_models():
 def load_conversation_history():
     if st.session_state.get("_loaded_user") != st.session_state.username:
         logger.info("event=app_loading_history user=%s", st.session_state.username)
-        conv = get_conversation_context(st.session_state.username, limit=200)
+        conv = get_conversation_context(st.session_state.username, limit=_MAX_MESSAGES // 2)
         st.session_state.messages = conv if conv else []
         st.session_state._loaded_user = st.session_state.username
 
@@ -155,6 +160,7 @@ def process_chat_response(prompt: str, conversation_history: list):
     deep_analysis = None
     
     if enable_web_search and agent_mode in ["Search", "Research"]:
+        from core.services.intelligent_agent import IntelligentAgent
         with st.spinner("🔍 Searching web..."):
             logger.info("event=agent_mode_activated mode=%s", agent_mode)
             agent_result = IntelligentAgent.process_with_tools(
@@ -174,6 +180,30 @@ def process_chat_response(prompt: str, conversation_history: list):
                 bot_text = f"Error: {agent_result.get('error')}"
                 success = False
                 logger.error("event=agent_failed error=%s", agent_result.get('error'))
+    elif st.session_state.get("enable_streaming", False):
+        with st.chat_message("assistant"):
+            try:
+                bot_text = st.write_stream(StreamingClient.stream_response(
+                    prompt,
+                    st.session_state.selected_model,
+                    conversation_history=conversation_history
+                ))
+                success = bool(bot_text)
+            except Exception as e:
+                logger.error("event=app_stream_failed error=%s", str(e))
+                bot_text = f"Error: {str(e)}"
+                st.error(bot_text)
+        if success:
+            try:
+                deep_analysis = analyze_deep_psychology(
+                    prompt=prompt,
+                    response=bot_text,
+                    conversation_history=conversation_history
+                )
+            except Exception as e:
+                logger.error("event=app_stream_deep_analysis_failed error=%s", str(e))
+        elif not bot_text:
+            bot_text = "Error generating response"
     else:
         with st.spinner("💭 Thinking..."):
             ai_result = get_ai_response(
@@ -193,6 +223,42 @@ def process_chat_response(prompt: str, conversation_history: list):
     return bot_text, success, deep_analysis
 
 
+@st.cache_resource
+def _conversation_store_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="kg-store")
+
+
+def save_conversation_in_background(user: str, prompt: str, bot_text: str, model: str, deep_analysis):
+    # Stamp the turn now; queued saves can run minutes later and ordering depends on ts
+    ts_ns = time.time_ns()
+
+    def _save():
+        try:
+            store_conversation_as_knowledge_graph(
+                user,
+                prompt,
+                bot_text,
+                model=model,
+                version="latest",
+                metadata={"deep_analysis": deep_analysis} if deep_analysis else None,
+                ts_ns=ts_ns,
+            )
+            logger.info(
+                "event=app_conversation_saved user=%s model=%s has_deep_analysis=%s",
+                user,
+                model,
+                bool(deep_analysis),
+            )
+        except Exception as e:
+            logger.error(
+                "event=app_conversation_save_failed user=%s error=%s",
+                user,
+                str(e),
+            )
+
+    _conversation_store_executor().submit(_save)
+
+
 def extract_emotional_state(deep_analysis):
     emotion = "neutral"
     intensity = 5
@@ -465,7 +531,12 @@ def main():
     
     with tab_chat:
         st.session_state.active_tab = "chat"
-        for msg in st.session_state.messages:
+        earlier = st.session_state.messages[:-_VISIBLE_MESSAGES]
+        if earlier and st.checkbox("Show earlier messages", value=False, key="show_earlier_messages"):
+            for msg in earlier:
+                with st.chat_message(msg["role"]):
+                    st.write(msg["text"])
+        for msg in st.session_state.messages[-_VISIBLE_MESSAGES:]:
             with st.chat_message(msg["role"]):
                 st.write(msg["text"])
 
@@ -475,7 +546,7 @@ def main():
         if prompt:
             st.session_state.messages.append({"role": "user", "text": prompt})
 
-            start = time.time()
+            start = time.perf_counter()
             logger.info(
                 "event=app_chat_request model=%s user=%s category=%s prompt_len=%s",
                 st.session_state.selected_model,
@@ -490,7 +561,7 @@ def main():
                 conversation_history.append({"role": role, "content": msg["text"]})
 
             bot_text, success, deep_analysis = process_chat_response(prompt, conversation_history)
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             
             emotion, intensity, meta_core = extract_emotional_state(deep_analysis)
 
@@ -506,28 +577,15 @@ def main():
             )
 
             st.session_state.messages.append({"role": "assistant", "text": bot_text})
+            del st.session_state.messages[:-_MAX_MESSAGES]
 
-            try:
-                store_conversation_as_knowledge_graph(
-                    st.session_state.username,
-                    prompt,
-                    bot_text,
-                    model=st.session_state.selected_model,
-                    version="latest",
-                    metadata={"deep_analysis": deep_analysis} if deep_analysis else None,
-                )
-                logger.info(
-                    "event=app_conversation_saved user=%s model=%s has_deep_analysis=%s",
-                    st.session_state.username,
-                    st.session_state.selected_model,
-                    bool(deep_analysis),
-                )
-            except Exception as e:
-                logger.error(
-                    "event=app_conversation_save_failed user=%s error=%s",
-                    st.session_state.username,
-                    str(e),
-                )
+            save_conversation_in_background(
+                st.session_state.username,
+                prompt,
+                bot_text,
+                st.session_state.selected_model,
+                deep_analysis,
+            )
             
             st.rerun()
     
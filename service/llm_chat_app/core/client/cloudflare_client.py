@@ -1,26 +1,55 @@
 import logging
+import threading
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, List, Optional
 from core.config.config import CLOUDFLARE_ACCOUNT_ID, CLOUDFLARE_API_TOKEN
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api.cloudflare.com/client/v4"
 _MODELS_CACHE: Optional[List[Dict[str, Any]]] = None
+_MODELS_LOCK = threading.Lock()
+_HEADERS: Dict[str, str] = {
+    "Authorization": f"Bearer {CLOUDFLARE_API_TOKEN}",
+    "Content-Type": "application/json"
+}
 
-def _get_headers() -> Dict[str, str]:
-    return {
-        "Authorization": f"Bearer {CLOUDFLARE_API_TOKEN}",
-        "Content-Type": "application/json"
-    }
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+# Streamlit runs each browser session on its own thread, so size the pool past
+# the default of 10; only retry responses that mean the request was not served.
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False
+    )
+))
 
 def fetch_models_from_api(force_refresh: bool = False) -> List[Dict[str, Any]]:
-    global _MODELS_CACHE
-    
     if _MODELS_CACHE is not None and not force_refresh:
         logger.info("event=models_cache_hit count=%s", len(_MODELS_CACHE))
         return _MODELS_CACHE
     
+    # Concurrent sessions on a cold cache wait for a single fetch instead of
+    # each calling the API.
+    with _MODELS_LOCK:
+        if _MODELS_CACHE is not None and not force_refresh:
+            logger.info("event=models_cache_hit count=%s", len(_MODELS_CACHE))
+            return _MODELS_CACHE
+        return _fetch_models()
+
+def _fetch_models() -> List[Dict[str, Any]]:
+    global _MODELS_CACHE
+    
     if not CLOUDFLARE_ACCOUNT_ID or not CLOUDFLARE_API_TOKEN:
         logger.error("event=models_fetch_no_credentials")
         return []
@@ -30,7 +59,7 @@ def fetch_models_from_api(force_refresh: bool = False) -> List[Dict[str, Any]]:
     logger.info("event=models_fetch_start url=%s", url)
     
     try:
-        resp = requests.get(url, headers=_get_headers(), timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         
         if not resp.ok:
             logger.error("event=models_fetch_failed status=%s body=%s", resp.status_code, resp.text[:200])
@@ -100,7 +129,7 @@ def run_model(model_name: str, prompt: str, params: Optional[Dict[str, Any]] = N
     logger.info("event=run_model_start model=%s url=%s messages_count=%s", model_name, url, len(payload.get("messages", [])))
     
     try:
-        resp = requests.post(url, json=payload, headers=_get_headers(), timeout=timeout)
+        resp = _SESSION.post(url, json=payload, timeout=timeout)
         
         try:
             body = resp.json()
@@ -114,7 +143,7 @@ def run_model(model_name: str, prompt: str, params: Optional[Dict[str, Any]] = N
                 if isinstance(errors, list) and len(errors) > 0:
                     error_msg = errors[0].get("message", error_msg)
             
-            logger.error("event=run_model_failed model=%s status=%s body=%s", model_name, resp.status_code, body)
+            logger.error("event=run_model_failed model=%s status=%s body=%s", model_name, resp.status_code, str(body)[:200])
             return {
                 "success": False,
                 "status_code": resp.status_code,
@@ -135,4 +164,34 @@ def run_model(model_name: str, prompt: str, params: Optional[Dict[str, Any]] = N
         return {"success": False, "error": "Request timeout"}
     except Exception as e:
         logger.exception("event=run_model_exception model=%s error=%s", model_name, str(e))
-        return {"success": False, "error": str(e)}
\ No newline at end of file
+        return {"success": False, "error": str(e)}
+
+
+# Yields raw SSE data payloads; raises if the stream ends without [DONE]
+def stream_model(model_name: str, messages: List[Dict[str, str]], timeout: int = 30) -> Iterator[str]:
+    if not CLOUDFLARE_ACCOUNT_ID or not CLOUDFLARE_API_TOKEN:
+        logger.error("event=stream_model_no_credentials model=%s", model_name)
+        raise RuntimeError("Cloudflare credentials are not configured")
+    
+    url = f"{_BASE_URL}/accounts/{CLOUDFLARE_ACCOUNT_ID}/ai/run/{model_name}"
+    
+    logger.info("event=stream_model_start model=%s messages_count=%s", model_name, len(messages))
+    
+    with _SESSION.post(url, json={"messages": messages, "stream": True}, timeout=timeout, stream=True) as resp:
+        if not resp.ok:
+            logger.error("event=stream_model_failed model=%s status=%s", model_name, resp.status_code)
+            raise RuntimeError(f"HTTP {resp.status_code}")
+        
+        # text/event-stream has no charset, so requests would fall back to ISO-8859-1
+        resp.encoding = "utf-8"
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                logger.info("event=stream_model_success model=%s", model_name)
+                return
+            yield data
+    
+    logger.error("event=stream_model_truncated model=%s", model_name)
+    raise RuntimeError("Stream ended before completion")
@@ -2,96 +2,58 @@ import logging
 import asyncio
 import json
 import re
-from typing import AsyncGenerator, Dict, Any, List, Optional
-from core.client.cloudflare_client import run_model
+import requests
+from typing import AsyncGenerator, Dict, Any, Iterator, List, Optional
+from core.client.cloudflare_client import run_model, stream_model
 
 logger = logging.getLogger(__name__)
 
 class StreamingClient:
     
     @staticmethod
-    async def stream_response(
+    def stream_response(
         prompt: str,
         model: str,
         conversation_history: Optional[List[Dict[str, str]]] = None,
         timeout: int = 30
-    ) -> AsyncGenerator[str, None]:
+    ) -> Iterator[str]:
         
-        if not prompt or not isinstance(prompt, str):
-            yield "Error: Invalid prompt"
-            return
+        if not prompt or not prompt.strip():
+            logger.error("event=stream_response_empty_prompt model=%s", model)
+            raise ValueError("Please provide a prompt")
         
-        if not model or not isinstance(model, str):
-            yield "Error: Invalid model"
-            return
+        if not model or not model.strip():
+            logger.error("event=stream_response_empty_model")
+            raise ValueError("No model selected")
+        
+        messages = list(conversation_history or [])
+        messages.append({"role": "user", "content": prompt})
         
-        logger.info("event=stream_response_start model=%s prompt_len=%s", model, len(prompt))
+        logger.info("event=stream_response_start model=%s prompt_len=%s messages=%s", model, len(prompt), len(messages))
         
+        chunks = 0
         try:
-            messages = []
-            if conversation_history and isinstance(conversation_history, list):
-                for msg in conversation_history[-10:]:
-                    if isinstance(msg, dict):
-                        messages.append({
-                            "role": msg.get("role", "user"),
-                            "content": msg.get("content", msg.get("text", ""))
-                        })
-            
-            messages.append({"role": "user", "content": prompt})
-            
-            body = {
-                "messages": messages,
-                "stream": True
-            }
-            
-            logger.info("event=stream_model_call model=%s messages=%s", model, len(messages))
-            
-            result = await asyncio.to_thread(
-                run_model,
-                model=model,
-                body=body,
-                timeout=timeout
-            )
-            
-            if not result or not result.get("success"):
-                error_msg = result.get("error", "Unknown error") if result else "No response"
-                logger.error("event=stream_model_failed error=%s", error_msg)
-                yield f"Error: {error_msg}"
-                return
-            
-            response_text = ""
-            body_data = result.get("body", {})
-            result_data = body_data.get("result", {})
-            
-            if isinstance(result_data, dict):
-                choices = result_data.get("choices", [])
-                if isinstance(choices, list) and len(choices) > 0:
-                    first_choice = choices[0]
-                    if isinstance(first_choice, dict):
-                        message = first_choice.get("message", {})
-                        if isinstance(message, dict):
-                            response_text = message.get("content", "")
-            
-            if not response_text:
-                logger.warning("event=stream_empty_response")
-                yield "No response generated"
-                return
-            
-            chunk_size = 20
-            for i in range(0, len(response_text), chunk_size):
-                chunk = response_text[i:i + chunk_size]
-                logger.debug("event=stream_chunk_sent size=%s", len(chunk))
-                yield chunk
-                await asyncio.sleep(0.01)
-            
-            logger.info("event=stream_response_complete total_len=%s", len(response_text))
-            
-        except asyncio.TimeoutError:
-            logger.error("event=stream_response_timeout")
-            yield "Error: Request timed out"
+            for data in stream_model(model, messages, timeout=timeout):
+                try:
+                    event = json.loads(data)
+                except ValueError:
+                    continue
+                text = event.get("response")
+                if text is None:
+                    choices = event.get("choices") or [{}]
+                    text = choices[0].get("delta", {}).get("content")
+                if text:
+                    chunks += 1
+                    yield text
+        
+        except requests.exceptions.Timeout:
+            logger.error("event=stream_response_timeout model=%s chunks=%s", model, chunks)
+            raise
         except Exception as e:
-            logger.error("event=stream_response_exception error=%s", str(e))
-            yield f"Error: {str(e)}"
+            logger.error("event=stream_response_exception model=%s chunks=%s error=%s", model, chunks, str(e))
+            raise
+        
+        logger.info("event=stream_response_complete model=%s chunks=%s", model, chunks)
     
     @staticmethod
     async def stream_with_tools(
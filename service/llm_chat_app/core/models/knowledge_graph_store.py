@@ -2,6 +2,8 @@ import os
 import json
 import logging
 import socket
+import threading
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from core.config.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
@@ -23,6 +25,22 @@ except Exception as e:
     _NEO4J_AVAILABLE = False
     logger.warning("event=neo4j_import_failed error=%s", str(e))
 
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+def neo4j_available() -> bool:
+    return _NEO4J_AVAILABLE
+
+def get_neo4j_driver():
+    global _DRIVER
+    
+    if _DRIVER is None:
+        with _DRIVER_LOCK:
+            if _DRIVER is None:
+                _DRIVER = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+                logger.info("event=kg_neo4j_driver_created uri=%s", NEO4J_URI[:20] + "...")
+    return _DRIVER
+
 def _host_resolves(uri: Optional[str]) -> bool:
     if not uri:
         logger.debug("event=host_resolve_check result=empty_uri")
@@ -83,19 +101,26 @@ def store_conversation_as_knowledge_graph(
     model: str = "unknown", 
     version: str = "unknown",
     metadata: Optional[Dict[str, Any]] = None,
-    conversation_history: Optional[List[Dict[str, str]]] = None
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    ts_ns: Optional[int] = None
 ) -> None:
-    ts = int(__import__("time").time())
+    # Callers that store off the request path pass the time the reply was produced
+    if ts_ns is None:
+        ts_ns = time.time_ns()
+    ts = ts_ns // 1_000_000_000
+    conversation_id = f"{user}_{ts_ns}"
     
     logger.info("event=kg_store_start user=%s model=%s prompt_len=%s response_len=%s ts=%s history_len=%s", 
                 user, model, len(prompt), len(response), ts, len(conversation_history) if conversation_history else 0)
     
     logger.info("event=kg_deep_analysis_start user=%s ts=%s", user, ts)
     deep_analysis = analyze_user_intent_and_emotion(prompt, response, conversation_history)
+    emotion = deep_analysis.get("emotion", {})
+    intent = deep_analysis.get("intent", {})
     logger.info("event=kg_deep_analysis_complete user=%s emotion=%s intent=%s", 
                 user, 
-                deep_analysis.get("emotion", {}).get("primary"),
-                deep_analysis.get("intent", {}).get("primary"))
+                emotion.get("primary"),
+                intent.get("primary"))
     
     # Extract entities and topics from deep_analysis
     entities = deep_analysis.get("entities", [])
@@ -107,13 +132,17 @@ def store_conversation_as_knowledge_graph(
     if not isinstance(topics, list):
         topics = [topics] if topics else []
     
+    # The model often repeats names; keep the first occurrence of each
+    entities = list(dict.fromkeys(e for e in entities if isinstance(e, str) and e))
+    topics = list(dict.fromkeys(t for t in topics if isinstance(t, str) and t))
+    
     logger.info("event=kg_extracted entities=%s topics=%s", len(entities), len(topics))
     
     try:
         if _NEO4J_AVAILABLE and NEO4J_URI and _host_resolves(NEO4J_URI):
             logger.info("event=kg_neo4j_connecting uri=%s", NEO4J_URI[:20] + "...")
             
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+            driver = get_neo4j_driver()
             
             try:
                 with driver.session() as session:
@@ -152,16 +181,16 @@ def store_conversation_as_knowledge_graph(
                         RETURN id(c) as conv_id
                         """,
                         {
-                            "id": f"{user}_{ts}",
+                            "id": conversation_id,
                             "prompt": prompt,
                             "response": response,
                             "model": model,
                             "version": version,
                             "ts": ts,
-                            "emotion_primary": deep_analysis.get("emotion", {}).get("primary", "neutral"),
-                            "emotion_intensity": deep_analysis.get("emotion", {}).get("intensity", 5),
-                            "intent_primary": deep_analysis.get("intent", {}).get("primary", "learn"),
-                            "urgency": deep_analysis.get("intent", {}).get("urgency", 5),
+                            "emotion_primary": emotion.get("primary", "neutral"),
+                            "emotion_intensity": emotion.get("intensity", 5),
+                            "intent_primary": intent.get("primary", "learn"),
+                            "urgency": intent.get("urgency", 5),
                             "knowledge_level": deep_analysis.get("meta_level_3_context", {}).get("user_knowledge_level", "intermediate"),
                             "cognitive_load": deep_analysis.get("meta_level_5_psychological", {}).get("cognitive_load", 5),
                             "confidence": deep_analysis.get("meta_level_4_patterns", {}).get("confidence_level", 5),
@@ -171,8 +200,8 @@ def store_conversation_as_knowledge_graph(
                     conv_id = conv_result.single()["conv_id"]
                     logger.info("event=kg_conversation_created conv_id=%s emotion=%s intent=%s", 
                                conv_id,
-                               deep_analysis.get("emotion", {}).get("primary"),
-                               deep_analysis.get("intent", {}).get("primary"))
+                               emotion.get("primary"),
+                               intent.get("primary"))
                     
                     session.run(
                         """
@@ -180,7 +209,7 @@ def store_conversation_as_knowledge_graph(
                         MATCH (c:Conversation {id: $conv_id})
                         MERGE (u)-[:ASKED]->(c)
                         """,
-                        {"user": user, "conv_id": f"{user}_{ts}"}
+                        {"user": user, "conv_id": conversation_id}
                     )
                     logger.debug("event=kg_user_asked_relation user=%s", user)
                     
@@ -190,35 +219,35 @@ def store_conversation_as_knowledge_graph(
                         MATCH (c:Conversation {id: $conv_id})
                         MERGE (m)-[:RESPONDED_TO]->(c)
                         """,
-                        {"model": model, "conv_id": f"{user}_{ts}"}
+                        {"model": model, "conv_id": conversation_id}
                     )
                     logger.debug("event=kg_model_responded_relation model=%s", model)
                     
-                    for topic in topics:
+                    if topics:
                         session.run(
                             """
-                            MERGE (t:Topic {name: $topic})
-                            WITH t
                             MATCH (c:Conversation {id: $conv_id})
+                            UNWIND $topics AS topic
+                            MERGE (t:Topic {name: topic})
                             MERGE (c)-[:ABOUT]->(t)
                             """,
-                            {"topic": topic, "conv_id": f"{user}_{ts}"}
+                            {"topics": topics, "conv_id": conversation_id}
                         )
-                        logger.debug("event=kg_topic_linked topic=%s", topic)
+                        logger.debug("event=kg_topics_linked count=%s", len(topics))
                     
-                    for entity in entities:
+                    if entities:
                         session.run(
                             """
-                            MERGE (e:Entity {name: $entity})
-                            WITH e
                             MATCH (c:Conversation {id: $conv_id})
+                            UNWIND $entities AS entity
+                            MERGE (e:Entity {name: entity})
                             MERGE (c)-[:MENTIONS]->(e)
                             """,
-                            {"entity": entity, "conv_id": f"{user}_{ts}"}
+                            {"entities": entities, "conv_id": conversation_id}
                         )
-                        logger.debug("event=kg_entity_linked entity=%s", entity[:30])
+                        logger.debug("event=kg_entities_linked count=%s", len(entities))
                     
-                    emotion_node_name = deep_analysis.get("emotion", {}).get("primary", "neutral")
+                    emotion_node_name = emotion.get("primary", "neutral")
                     session.run(
                         """
                         MERGE (em:Emotion {name: $emotion})
@@ -228,13 +257,13 @@ def store_conversation_as_knowledge_graph(
                         """,
                         {
                             "emotion": emotion_node_name,
-                            "intensity": deep_analysis.get("emotion", {}).get("intensity", 5),
-                            "conv_id": f"{user}_{ts}"
+                            "intensity": emotion.get("intensity", 5),
+                            "conv_id": conversation_id
                         }
                     )
                     logger.debug("event=kg_emotion_linked emotion=%s intensity=%s", 
                                 emotion_node_name, 
-                                deep_analysis.get("emotion", {}).get("intensity"))
+                                emotion.get("intensity"))
                     
                     prev_conversations = session.run(
                         """
@@ -251,7 +280,7 @@ def store_conversation_as_knowledge_graph(
                     if prev_record:
                         prev_id = prev_record["prev_id"]
                         prev_emotion = prev_record.get("prev_emotion", "neutral")
-                        curr_emotion = deep_analysis.get("emotion", {}).get("primary", "neutral")
+                        curr_emotion = emotion.get("primary", "neutral")
                         
                         session.run(
                             """
@@ -264,33 +293,23 @@ def store_conversation_as_knowledge_graph(
                             """,
                             {
                                 "prev_id": prev_id,
-                                "curr_id": f"{user}_{ts}",
+                                "curr_id": conversation_id,
                                 "emotion_shift": f"{prev_emotion}_to_{curr_emotion}",
                                 "time_gap": 0
                             }
                         )
                         logger.info("event=kg_conversation_chain prev=%s curr=%s emotion_shift=%s_to_%s", 
-                                   prev_id, f"{user}_{ts}", prev_emotion, curr_emotion)
-                
-                try:
-                    driver.close()
-                    logger.debug("event=kg_neo4j_driver_closed")
-                except Exception:
-                    pass
+                                   prev_id, conversation_id, prev_emotion, curr_emotion)
                 
                 logger.info("event=kg_neo4j_success user=%s model=%s entities=%s topics=%s emotion=%s intent=%s knowledge=%s", 
                            user, model, len(entities), len(topics),
-                           deep_analysis.get("emotion", {}).get("primary"),
-                           deep_analysis.get("intent", {}).get("primary"),
+                           emotion.get("primary"),
+                           intent.get("primary"),
                            deep_analysis.get("meta_level_3_context", {}).get("user_knowledge_level"))
                 return
                 
             except Exception as e:
                 logger.error("event=kg_neo4j_failed user=%s model=%s error=%s", user, model, str(e))
-                try:
-                    driver.close()
-                except Exception:
-                    pass
     except Exception as e:
         logger.error("event=kg_neo4j_unavailable error=%s", str(e))
     
@@ -316,7 +335,7 @@ def store_conversation_as_knowledge_graph(
         
         logger.info("event=kg_file_success user=%s model=%s path=%s emotion=%s", 
                    user, model, str(_LOCAL_STORE),
-                   deep_analysis.get("emotion", {}).get("primary"))
+                   emotion.get("primary"))
         
     except Exception as e:
         logger.error("event=kg_file_failed user=%s error=%s", user, str(e))
@@ -330,7 +349,7 @@ def get_conversation_context(user: str, limit: int = 10) -> List[Dict]:
         if _NEO4J_AVAILABLE and NEO4J_URI and _host_resolves(NEO4J_URI):
             logger.info("event=kg_query_neo4j_start user=%s", user)
             
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+            driver = get_neo4j_driver()
             
             try:
                 with driver.session() as session:
@@ -368,20 +387,11 @@ def get_conversation_context(user: str, limit: int = 10) -> List[Dict]:
                             "entities": r.get("entities", [])
                         })
                 
-                try:
-                    driver.close()
-                except Exception:
-                    pass
-                
                 logger.info("event=kg_query_neo4j_success user=%s count=%s", user, len(results))
                 return results[-limit * 2:]
                 
             except Exception as e:
                 logger.error("event=kg_query_neo4j_failed user=%s error=%s", user, str(e))
-                try:
-                    driver.close()
-                except Exception:
-                    pass
     except Exception as e:
         logger.error("event=kg_query_neo4j_unavailable error=%s", str(e))
     
@@ -423,7 +433,7 @@ def query_by_topic(topic: str, limit: int = 10) -> List[Dict]:
     
     try:
         if _NEO4J_AVAILABLE and NEO4J_URI and _host_resolves(NEO4J_URI):
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+            driver = get_neo4j_driver()
             
             try:
                 with driver.session() as session:
@@ -451,19 +461,10 @@ def query_by_topic(topic: str, limit: int = 10) -> List[Dict]:
                             "ts": r["ts"]
                         })
                 
-                try:
-                    driver.close()
-                except Exception:
-                    pass
-                
                 logger.info("event=kg_query_topic_success topic=%s count=%s", topic, len(results))
                 
             except Exception as e:
                 logger.error("event=kg_query_topic_failed topic=%s error=%s", topic, str(e))
-                try:
-                    driver.close()
-                except Exception:
-                    pass
     except Exception as e:
         logger.error("event=kg_query_topic_unavailable error=%s", str(e))
     
@@ -481,7 +482,7 @@ def get_user_statistics(user: str) -> Dict[str, Any]:
     
     try:
         if _NEO4J_AVAILABLE and NEO4J_URI and _host_resolves(NEO4J_URI):
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+            driver = get_neo4j_driver()
             
             try:
                 with driver.session() as session:
@@ -505,19 +506,10 @@ def get_user_statistics(user: str) -> Dict[str, Any]:
                         stats["top_topics"] = [t for t in record["topics"] if t]
                         stats["total_entities"] = record["entities"]
                 
-                try:
-                    driver.close()
-                except Exception:
-                    pass
-                
                 logger.info("event=kg_stats_success user=%s stats=%s", user, stats)
                 
             except Exception as e:
                 logger.error("event=kg_stats_failed user=%s error=%s", user, str(e))
-                try:
-                    driver.close()
-                except Exception:
-                    pass
     except Exception as e:
         logger.error("event=kg_stats_unavailable error=%s", str(e))
     
@@ -22,7 +22,7 @@ for file in [_USERS_FILE, _SESSIONS_FILE, _RESET_TOKENS_FILE]:
 
 
 def _hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
-    start = time.time()
+    start = time.perf_counter()
     if salt is None:
         salt = secrets.token_hex(16)
 
@@ -30,76 +30,76 @@ def _hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]
     for _ in range(10000):
         hashed = hashlib.sha256(hashed.encode()).hexdigest()
 
-    duration = int((time.time() - start) * 1000)
-    logger.debug(f"event=password_hash duration_ms={duration} salt_length={len(salt)}")
+    duration = int((time.perf_counter() - start) * 1000)
+    logger.debug("event=password_hash duration_ms=%s salt_length=%s", duration, len(salt))
     return hashed, salt
 
 
 def _verify_password(password: str, hashed: str, salt: str) -> bool:
-    start = time.time()
+    start = time.perf_counter()
     computed_hash, _ = _hash_password(password, salt)
     ok = computed_hash == hashed
-    duration = int((time.time() - start) * 1000)
-    logger.debug(f"event=password_verify match={ok} duration_ms={duration}")
+    duration = int((time.perf_counter() - start) * 1000)
+    logger.debug("event=password_verify match=%s duration_ms=%s", ok, duration)
     return ok
 
 
 def _generate_session_token() -> str:
     token = secrets.token_urlsafe(32)
-    logger.debug(f"event=session_token_generated token_prefix={token[:8]}")
+    logger.debug("event=session_token_generated token_prefix=%s", token[:8])
     return token
 
 
 def _generate_reset_token() -> str:
     token = secrets.token_urlsafe(32)
-    logger.debug(f"event=reset_token_generated token_prefix={token[:8]}")
+    logger.debug("event=reset_token_generated token_prefix=%s", token[:8])
     return token
 
 
 def _load_json(file_path: Path) -> list:
     try:
         data = json.loads(file_path.read_text())
-        logger.debug(f"event=json_load_success file={file_path.name} records={len(data)}")
+        logger.debug("event=json_load_success file=%s records=%s", file_path.name, len(data))
         return data
     except Exception as e:
-        logger.error(f"event=json_load_failed file={file_path.name} error={e}")
+        logger.error("event=json_load_failed file=%s error=%s", file_path.name, e)
         return []
 
 
 def _save_json(file_path: Path, data: list) -> bool:
     try:
         file_path.write_text(json.dumps(data, indent=2))
-        logger.debug(f"event=json_save_success file={file_path.name} records={len(data)}")
+        logger.debug("event=json_save_success file=%s records=%s", file_path.name, len(data))
         return True
     except Exception as e:
-        logger.error(f"event=json_save_failed file={file_path.name} error={e}")
+        logger.error("event=json_save_failed file=%s error=%s", file_path.name, e)
         return False
 
 
 def register_user(username: str, password: str, email: str) -> Dict[str, Any]:
-    start = time.time()
-    logger.info(f"event=register_attempt username={username} email={email}")
+    start = time.perf_counter()
+    logger.info("event=register_attempt username=%s email=%s", username, email)
 
     if not username or len(username) < 3:
-        logger.warning(f"event=register_failed username={username} reason=invalid_username")
+        logger.warning("event=register_failed username=%s reason=invalid_username", username)
         return {"success": False, "message": "Username must be at least 3 characters"}
 
     if not password or len(password) < 6:
-        logger.warning(f"event=register_failed username={username} reason=weak_password")
+        logger.warning("event=register_failed username=%s reason=weak_password", username)
         return {"success": False, "message": "Password must be at least 6 characters"}
 
     if not email or "@" not in email:
-        logger.warning(f"event=register_failed username={username} reason=invalid_email")
+        logger.warning("event=register_failed username=%s reason=invalid_email", username)
         return {"success": False, "message": "Invalid email address"}
 
     users = _load_json(_USERS_FILE)
 
     if any(u["username"] == username for u in users):
-        logger.warning(f"event=register_failed username={username} reason=username_exists")
+        logger.warning("event=register_failed username=%s reason=username_exists", username)
         return {"success": False, "message": "Username already exists"}
 
     if any(u["email"] == email for u in users):
-        logger.warning(f"event=register_failed email={email} reason=email_exists")
+        logger.warning("event=register_failed email=%s reason=email_exists", email)
         return {"success": False, "message": "Email already registered"}
 
     hashed_password, salt = _hash_password(password)
@@ -116,31 +116,31 @@ def register_user(username: str, password: str, email: str) -> Dict[str, Any]:
     users.append(user)
 
     if _save_json(_USERS_FILE, users):
-        duration = int((time.time() - start) * 1000)
-        logger.info(f"event=register_success username={username} duration_ms={duration}")
+        duration = int((time.perf_counter() - start) * 1000)
+        logger.info("event=register_success username=%s duration_ms=%s", username, duration)
         return {"success": True, "message": "Registration successful"}
     else:
-        logger.error(f"event=register_failed username={username} reason=save_error")
+        logger.error("event=register_failed username=%s reason=save_error", username)
         return {"success": False, "message": "Failed to save user data"}
 
 
 def sign_in(username: str, password: str) -> Dict[str, Any]:
-    start = time.time()
-    logger.info(f"event=signin_attempt username={username}")
+    start = time.perf_counter()
+    logger.info("event=signin_attempt username=%s", username)
 
     users = _load_json(_USERS_FILE)
     user = next((u for u in users if u["username"] == username), None)
 
     if not user:
-        logger.warning(f"event=signin_failed username={username} reason=user_not_found")
+        logger.warning("event=signin_failed username=%s reason=user_not_found", username)
         return {"success": False, "message": "Invalid username or password"}
 
     if not user.get("is_active", True):
-        logger.warning(f"event=signin_failed username={username} reason=inactive_account")
+        logger.warning("event=signin_failed username=%s reason=inactive_account", username)
         return {"success": False, "message": "Account is deactivated"}
 
     if not _verify_password(password, user["password_hash"], user["salt"]):
-        logger.warning(f"event=signin_failed username={username} reason=wrong_password")
+        logger.warning("event=signin_failed username=%s reason=wrong_password", username)
         return {"success": False, "message": "Invalid username or password"}
 
     session_token = _generate_session_token()
@@ -158,8 +158,8 @@ def sign_in(username: str, password: str) -> Dict[str, Any]:
     sessions.append(session)
     _save_json(_SESSIONS_FILE, sessions)
 
-    duration = int((time.time() - start) * 1000)
-    logger.info(f"event=signin_success username={username} token_prefix={session_token[:8]} duration_ms={duration}")
+    duration = int((time.perf_counter() - start) * 1000)
+    logger.info("event=signin_success username=%s token_prefix=%s duration_ms=%s", username, session_token[:8], duration)
 
     return {
         "success": True,
@@ -170,31 +170,31 @@ def sign_in(username: str, password: str) -> Dict[str, Any]:
 
 
 def sign_out(session_token: str) -> Dict[str, Any]:
-    logger.info(f"event=signout_attempt token_prefix={session_token[:8]}")
+    logger.info("event=signout_attempt token_prefix=%s", session_token[:8])
 
     sessions = _load_json(_SESSIONS_FILE)
     session = next((s for s in sessions if s["token"] == session_token), None)
 
     if not session:
-        logger.warning(f"event=signout_failed token_prefix={session_token[:8]} reason=invalid_token")
+        logger.warning("event=signout_failed token_prefix=%s reason=invalid_token", session_token[:8])
         return {"success": False, "message": "Invalid session"}
 
     username = session["username"]
     sessions = [s for s in sessions if s["token"] != session_token]
     _save_json(_SESSIONS_FILE, sessions)
 
-    logger.info(f"event=signout_success username={username} token_prefix={session_token[:8]}")
+    logger.info("event=signout_success username=%s token_prefix=%s", username, session_token[:8])
     return {"success": True, "message": "Signed out successfully"}
 
 
 def validate_session(session_token: str) -> Optional[str]:
-    logger.debug(f"event=session_validate_attempt token_prefix={session_token[:8]}")
+    logger.debug("event=session_validate_attempt token_prefix=%s", session_token[:8])
 
     sessions = _load_json(_SESSIONS_FILE)
     session = next((s for s in sessions if s["token"] == session_token), None)
 
     if not session:
-        logger.debug(f"event=session_invalid token_prefix={session_token[:8]} reason=not_found")
+        logger.debug("event=session_invalid token_prefix=%s reason=not_found", session_token[:8])
         return None
 
     expires_at = datetime.fromisoformat(session["expires_at"])
@@ -202,22 +202,22 @@ def validate_session(session_token: str) -> Optional[str]:
     if datetime.now() > expires_at:
         sessions = [s for s in sessions if s["token"] != session_token]
         _save_json(_SESSIONS_FILE, sessions)
-        logger.info(f"event=session_expired username={session['username']} token_prefix={session_token[:8]}")
+        logger.info("event=session_expired username=%s token_prefix=%s", session['username'], session_token[:8])
         return None
 
-    logger.debug(f"event=session_valid username={session['username']} token_prefix={session_token[:8]}")
+    logger.debug("event=session_valid username=%s token_prefix=%s", session['username'], session_token[:8])
     return session["username"]
 
 
 def request_password_reset(email: str) -> Dict[str, Any]:
-    start = time.time()
-    logger.info(f"event=reset_request email={email}")
+    start = time.perf_counter()
+    logger.info("event=reset_request email=%s", email)
 
     users = _load_json(_USERS_FILE)
     user = next((u for u in users if u["email"] == email), None)
 
     if not user:
-        logger.warning(f"event=reset_request_unknown_email email={email}")
+        logger.warning("event=reset_request_unknown_email email=%s", email)
         return {"success": True, "message": "If the email exists, a reset token has been generated"}
 
     reset_token = _generate_reset_token()
@@ -236,8 +236,8 @@ def request_password_reset(email: str) -> Dict[str, Any]:
     reset_tokens.append(token_data)
     _save_json(_RESET_TOKENS_FILE, reset_tokens)
 
-    duration = int((time.time() - start) * 1000)
-    logger.info(f"event=reset_token_created username={user['username']} token_prefix={reset_token[:8]} duration_ms={duration}")
+    duration = int((time.perf_counter() - start) * 1000)
+    logger.info("event=reset_token_created username=%s token_prefix=%s duration_ms=%s", user['username'], reset_token[:8], duration)
 
     return {
         "success": True,
@@ -247,30 +247,30 @@ def request_password_reset(email: str) -> Dict[str, Any]:
 
 
 def reset_password(reset_token: str, new_password: str) -> Dict[str, Any]:
-    start = time.time()
-    logger.info(f"event=reset_password_attempt token_prefix={reset_token[:8]}")
+    start = time.perf_counter()
+    logger.info("event=reset_password_attempt token_prefix=%s", reset_token[:8])
 
     if not new_password or len(new_password) < 6:
-        logger.warning(f"event=reset_password_failed token_prefix={reset_token[:8]} reason=weak_password")
+        logger.warning("event=reset_password_failed token_prefix=%s reason=weak_password", reset_token[:8])
         return {"success": False, "message": "Password must be at least 6 characters"}
 
     reset_tokens = _load_json(_RESET_TOKENS_FILE)
     token_data = next((t for t in reset_tokens if t["token"] == reset_token), None)
 
     if not token_data:
-        logger.warning(f"event=reset_password_failed token_prefix={reset_token[:8]} reason=invalid_token")
+        logger.warning("event=reset_password_failed token_prefix=%s reason=invalid_token", reset_token[:8])
         return {"success": False, "message": "Invalid or expired reset token"}
 
     expires_at = datetime.fromisoformat(token_data["expires_at"])
     if datetime.now() > expires_at:
-        logger.warning(f"event=reset_password_failed username={token_data['username']} reason=expired_token")
+        logger.warning("event=reset_password_failed username=%s reason=expired_token", token_data['username'])
         return {"success": False, "message": "Reset token has expired"}
 
     users = _load_json(_USERS_FILE)
     user = next((u for u in users if u["username"] == token_data["username"]), None)
 
     if not user:
-        logger.error(f"event=reset_password_failed token_prefix={reset_token[:8]} reason=user_missing")
+        logger.error("event=reset_password_failed token_prefix=%s reason=user_missing", reset_token[:8])
         return {"success": False, "message": "User not found"}
 
     hashed_password, salt = _hash_password(new_password)
@@ -285,29 +285,29 @@ def reset_password(reset_token: str, new_password: str) -> Dict[str, Any]:
     sessions = [s for s in sessions if s["username"] != token_data["username"]]
     _save_json(_SESSIONS_FILE, sessions)
 
-    duration = int((time.time() - start) * 1000)
-    logger.info(f"event=reset_password_success username={token_data['username']} duration_ms={duration}")
+    duration = int((time.perf_counter() - start) * 1000)
+    logger.info("event=reset_password_success username=%s duration_ms=%s", token_data['username'], duration)
 
     return {"success": True, "message": "Password reset successful"}
 
 
 def change_password(username: str, old_password: str, new_password: str) -> Dict[str, Any]:
-    start = time.time()
-    logger.info(f"event=change_password_attempt username={username}")
+    start = time.perf_counter()
+    logger.info("event=change_password_attempt username=%s", username)
 
     if not new_password or len(new_password) < 6:
-        logger.warning(f"event=change_password_failed username={username} reason=weak_new_password")
+        logger.warning("event=change_password_failed username=%s reason=weak_new_password", username)
         return {"success": False, "message": "New password must be at least 6 characters"}
 
     users = _load_json(_USERS_FILE)
     user = next((u for u in users if u["username"] == username), None)
 
     if not user:
-        logger.error(f"event=change_password_failed username={username} reason=user_missing")
+        logger.error("event=change_password_failed username=%s reason=user_missing", username)
         return {"success": False, "message": "User not found"}
 
     if not _verify_password(old_password, user["password_hash"], user["salt"]):
-        logger.warning(f"event=change_password_failed username={username} reason=wrong_old_password")
+        logger.warning("event=change_password_failed username=%s reason=wrong_old_password", username)
         return {"success": False, "message": "Current password is incorrect"}
 
     hashed_password, salt = _hash_password(new_password)
@@ -315,24 +315,24 @@ def change_password(username: str, old_password: str, new_password: str) -> Dict
     user["salt"] = salt
 
     if _save_json(_USERS_FILE, users):
-        duration = int((time.time() - start) * 1000)
-        logger.info(f"event=change_password_success username={username} duration_ms={duration}")
+        duration = int((time.perf_counter() - start) * 1000)
+        logger.info("event=change_password_success username=%s duration_ms=%s", username, duration)
         return {"success": True, "message": "Password changed successfully"}
     else:
-        logger.error(f"event=change_password_failed username={username} reason=save_failed")
+        logger.error("event=change_password_failed username=%s reason=save_failed", username)
         return {"success": False, "message": "Failed to update password"}
 
 
 def get_user_info(username: str) -> Optional[Dict[str, Any]]:
-    logger.info(f"event=get_user_info username={username}")
+    logger.info("event=get_user_info username=%s", username)
     users = _load_json(_USERS_FILE)
     user = next((u for u in users if u["username"] == username), None)
 
     if not user:
-        logger.warning(f"event=get_user_info_failed username={username} reason=user_not_found")
+        logger.warning("event=get_user_info_failed username=%s reason=user_not_found", username)
         return None
 
-    logger.info(f"event=get_user_info_success username={username}")
+    logger.info("event=get_user_info_success username=%s", username)
     return {
         "username": user["username"],
         "email": user["email"],
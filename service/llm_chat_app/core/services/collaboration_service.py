@@ -15,7 +15,7 @@ _COLLAB_DIR.mkdir(parents=True, exist_ok=True)
 _ACTIVE_SESSIONS: Dict[str, "CollaborationSession"] = {}
 _SESSION_LOCK = threading.RLock()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CollaborationMessage:
     id: str
     user: str
@@ -148,6 +148,8 @@ class CollaborationService:
         if not content or not isinstance(content, str):
             return {"success": False, "error": "Invalid content"}
         
+        msg_id = str(uuid.uuid4())
+        
         with _SESSION_LOCK:
             if session_id not in _ACTIVE_SESSIONS:
                 session = _load_session(session_id)
@@ -161,7 +163,6 @@ class CollaborationService:
                 logger.warning("event=collab_user_not_in_session session_id=%s user=%s", session_id, user)
                 return {"success": False, "error": "User not in session"}
             
-            msg_id = str(uuid.uuid4())
             now = datetime.now().timestamp()
             
             message = CollaborationMessage(
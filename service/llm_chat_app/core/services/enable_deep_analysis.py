@@ -6,6 +6,9 @@ from core.client.cloudflare_client import run_model
 
 logger = logging.getLogger(__name__)
 
+_REDACTED_SECTIONS = frozenset({"layer_3_trauma_indicators", "ruthless_truth"})
+_SAFE_SECTION_KEYS = frozenset({"trauma_type", "defense_mechanism", "pattern_description", "real_barrier", "necessary_confrontation"})
+
 def analyze_deep_psychology(
     prompt: str,
     response: str,
@@ -248,11 +251,11 @@ def _sanitize_for_storage(analysis: Dict[str, Any]) -> Dict[str, Any]:
             logger.info("event=sanitize_removed section=data_to_forget")
             continue
         
-        if key in ["layer_3_trauma_indicators", "ruthless_truth"]:
+        if key in _REDACTED_SECTIONS:
             if isinstance(value, dict):
                 sanitized_section = {}
                 for k, v in value.items():
-                    if k in ["trauma_type", "defense_mechanism", "pattern_description", "real_barrier", "necessary_confrontation"]:
+                    if k in _SAFE_SECTION_KEYS:
                         sanitized_section[k] = v
                     else:
                         sanitized_section[k] = "REDACTED"
@@ -4,17 +4,11 @@ from typing import Optional, Dict, List, Any, Tuple
 from pathlib import Path
 import networkx as nx
 from pyvis.network import Network
-from core.config.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from core.config.config import NEO4J_URI
+from core.models.knowledge_graph_store import get_neo4j_driver, neo4j_available
 
 logger = logging.getLogger(__name__)
 
-try:
-    from neo4j import GraphDatabase
-    _NEO4J_AVAILABLE = True
-except Exception as e:
-    _NEO4J_AVAILABLE = False
-    logger.warning("event=neo4j_import_failed error=%s", str(e))
-
 
 class GraphVisualizationService:
     
@@ -109,13 +103,13 @@ class GraphVisualizationService:
     def fetch_graph_data(cypher_query: str) -> Tuple[Optional[Dict], Optional[str]]:
         logger.info("event=fetch_graph_data_start query_len=%s", len(cypher_query))
         
-        if not _NEO4J_AVAILABLE or not NEO4J_URI:
+        if not neo4j_available() or not NEO4J_URI:
             error_msg = "Neo4j not available"
             logger.warning("event=fetch_graph_data_unavailable")
             return None, error_msg
         
         try:
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+            driver = get_neo4j_driver()
             
             try:
                 with driver.session() as session:
@@ -174,11 +168,6 @@ class GraphVisualizationService:
                 error_msg = f"Query execution failed: {str(e)}"
                 logger.error("event=fetch_graph_data_query_failed error=%s", str(e))
                 return None, error_msg
-            finally:
-                try:
-                    driver.close()
-                except Exception:
-                    pass
                     
         except Exception as e:
             error_msg = f"Connection failed: {str(e)}"
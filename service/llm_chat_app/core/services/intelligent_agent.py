@@ -1,12 +1,15 @@
 import logging
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from core.client.web_search_tools import WebSearchTools, AVAILABLE_TOOLS
 from core.client.cloudflare_client import run_model
 
 logger = logging.getLogger(__name__)
 
+_MAX_RESEARCH_WORKERS = 5
+
 class IntelligentAgent:
     
     @staticmethod
@@ -137,21 +140,27 @@ class IntelligentAgent:
             f"{topic} guide"
         ][:search_count]
         
-        for query in search_queries:
+        def _search(query: str) -> Optional[Dict[str, Any]]:
             logger.info("event=agent_searching query=%s", query)
-            result = WebSearchTools.web_search(query, count=5)
-            if result and result.get("success"):
-                search_results.extend(result.get("results", []))
+            return WebSearchTools.web_search(query, count=5)
+        
+        with ThreadPoolExecutor(max_workers=_MAX_RESEARCH_WORKERS) as pool:
+            for result in pool.map(_search, search_queries):
+                if result and result.get("success"):
+                    search_results.extend(result.get("results", []))
         
         if not search_results:
             logger.warning("event=agent_no_search_results topic=%s", topic)
             return {"success": False, "error": "No search results found"}
         
+        urls = [
+            result.get("url") for result in search_results[:5]
+            if result.get("url") and isinstance(result.get("url"), str)
+        ]
+        
         content_snippets = []
-        for result in search_results[:5]:
-            url = result.get("url")
-            if url and isinstance(url, str):
-                content = WebSearchTools.visit_url(url)
+        with ThreadPoolExecutor(max_workers=_MAX_RESEARCH_WORKERS) as pool:
+            for url, content in zip(urls, pool.map(WebSearchTools.visit_url, urls)):
                 if content and content.get("success"):
                     content_snippets.append({
                         "url": url,
@@ -7,21 +7,23 @@ import os
 os.environ["DOCKER_BUILDKIT"] = "1"
 os.environ["BUILDKIT_PROGRESS"] = "plain"
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
+import aiohttp
 from temporalio import activity
 
-from infrastructure.orchestrator.base.base_container_activity import BaseService, ContainerConfig
+from infrastructure.orchestrator.base.base_container_activity import BaseService, ContainerConfig, get_docker_client
 from infrastructure.orchestrator.activities.configurations_activity.neo4j_activity import Neo4jManager
-from core.config.config import DEFAULT_IMAGE_TAG, DEFAULT_CONTAINER_NAME
+from core.config.config import DEFAULT_IMAGE_TAG, DEFAULT_CONTAINER_NAME, CLOUDFLARE_API_TOKEN
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 LLM_CHAT_SKIP_DOCKER = os.environ.get("LLM_CHAT_SKIP_DOCKER", "false").lower() in ("1", "true", "yes")
 LLM_CHAT_SKIP_CLOUDFLARE = os.environ.get("LLM_CHAT_SKIP_CLOUDFLARE", "false").lower() in ("1", "true", "yes")
+CLOUDFLARE_AI_URL = os.environ.get("CLOUDFLARE_AI_URL") or os.environ.get("CLOUDFLARE_AI_BASE")
 
 class ChatManager(BaseService):
     SERVICE_NAME = "Chat"
@@ -69,7 +71,7 @@ class ChatManager(BaseService):
 
     def build_image(self, path: str = ".", tag: Optional[str] = None) -> None:
         if LLM_CHAT_SKIP_DOCKER:
-            logger.info("build_image: skipped because LLM_CHAT_SKIP_DOCKER=%s", os.environ.get("LLM_CHAT_SKIP_DOCKER"))
+            logger.info("build_image: skipped because LLM_CHAT_SKIP_DOCKER=%s", LLM_CHAT_SKIP_DOCKER)
             return
 
         ctx = self._find_docker_context(path) or self._resolve_context(path)
@@ -107,7 +109,7 @@ class ChatManager(BaseService):
 
     def delete_image(self, force: bool = False) -> None:
         if LLM_CHAT_SKIP_DOCKER:
-            logger.info("op=delete_image status=skipped reason=LLM_CHAT_SKIP_DOCKER value=%s", os.environ.get("LLM_CHAT_SKIP_DOCKER"))
+            logger.info("op=delete_image status=skipped reason=LLM_CHAT_SKIP_DOCKER value=%s", LLM_CHAT_SKIP_DOCKER)
             return
 
         client = self.manager.client
@@ -216,8 +218,7 @@ async def run_chat_container_activity(params: Dict[str, Any]) -> bool:
     manager = ChatManager(image=image, name=name)
     try:
         try:
-            import docker
-            client = docker.from_env()
+            client = get_docker_client()
             try:
                 client.images.get(image)
             except Exception:
@@ -287,22 +288,14 @@ async def delete_neo4j_dependency_activity(params: Dict[str, Any]) -> bool:
 
 @activity.defn
 async def verify_cloudflare_dependency_activity(params: Dict[str, Any]) -> bool:
-    logger.info("event=start_verification params=%s", params)
+    logger.info("event=start_verification keys=%s", sorted(params))
 
     if LLM_CHAT_SKIP_CLOUDFLARE:
         logger.info("event=skip_verification reason=flag_enabled")
         return True
 
-    url = (
-        params.get("cloudflare_url")
-        or os.environ.get("CLOUDFLARE_AI_URL")
-        or os.environ.get("CLOUDFLARE_AI_BASE")
-    )
-
-    token = (
-        params.get("cloudflare_token")
-        or os.environ.get("CLOUDFLARE_API_TOKEN")
-    )
+    url = params.get("cloudflare_url") or CLOUDFLARE_AI_URL
+    token = params.get("cloudflare_token") or CLOUDFLARE_API_TOKEN
 
     logger.info("event=env_loaded url=%s token_present=%s", url, bool(token))
 
@@ -313,21 +306,26 @@ async def verify_cloudflare_dependency_activity(params: Dict[str, Any]) -> bool:
         logger.info("event=url_normalized model_url=%s", url)
 
     if not url or not token:
-        logger.error("event=missing_fields url=%s token=%s", url, token)
+        logger.error("event=missing_fields url=%s token_present=%s", url, bool(token))
         return False
 
     verify_url = "https://api.cloudflare.com/client/v4/user/tokens/verify"
     headers = {"Authorization": f"Bearer {token}"}
 
-    try:
-        resp1 = requests.get(verify_url, headers=headers, timeout=10)
-        logger.info("event=token_verify status=%s", resp1.status_code)
-
-        payload = {"prompt": "hello"}
-        resp2 = requests.post(url, headers=headers, json=payload, timeout=10)
-        logger.info("event=model_test status=%s", resp2.status_code)
+    async def _status(request) -> int:
+        async with request as resp:
+            return resp.status
 
-        ok = resp1.status_code < 400 and resp2.status_code < 400
+    try:
+        async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as session:
+            status1, status2 = await asyncio.gather(
+                _status(session.get(verify_url)),
+                _status(session.post(url, json={"prompt": "hello"})),
+            )
+        logger.info("event=token_verify status=%s", status1)
+        logger.info("event=model_test status=%s", status2)
+
+        ok = status1 < 400 and status2 < 400
         logger.info("event=verification_done success=%s", ok)
         return ok
 
@@ -339,23 +337,23 @@ async def verify_cloudflare_dependency_activity(params: Dict[str, Any]) -> bool:
 @activity.defn
 async def check_chat_health_activity(params: Dict[str, Any]) -> bool:
     if LLM_CHAT_SKIP_DOCKER:
-        logger.info("check_chat_health_activity: skipped because LLM_CHAT_SKIP_DOCKER=%s", os.environ.get("LLM_CHAT_SKIP_DOCKER"))
+        logger.info("check_chat_health_activity: skipped because LLM_CHAT_SKIP_DOCKER=%s", LLM_CHAT_SKIP_DOCKER)
         return True
-    import time
     host = params.get("host", "http://localhost:8501")
     attempts = int(params.get("attempts", 10))
     delay = float(params.get("initial_delay", 0.5))
     max_delay = float(params.get("max_delay", 5.0))
-    for i in range(1, attempts + 1):
-        try:
-            resp = requests.get(host, timeout=5)
-            logger.info("check_chat_health_activity attempt=%d status=%s host=%s", i, getattr(resp, "status_code", None), host)
-            if getattr(resp, "status_code", 999) < 400:
-                return True
-        except Exception as e:
-            logger.warning("check_chat_health_activity attempt=%d failed host=%s error=%s", i, host, e)
-        sleep_for = min(max_delay, delay * (2 ** (i - 1)))
-        time.sleep(sleep_for)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+        for i in range(1, attempts + 1):
+            try:
+                async with session.get(host) as resp:
+                    logger.info("check_chat_health_activity attempt=%d status=%s host=%s", i, resp.status, host)
+                    if resp.status < 400:
+                        return True
+            except Exception as e:
+                logger.warning("check_chat_health_activity attempt=%d failed host=%s error=%s", i, host, e)
+            sleep_for = min(max_delay, delay * (2 ** (i - 1)))
+            await asyncio.sleep(sleep_for)
     logger.error("check_chat_health_activity failed host=%s after=%d attempts", host, attempts)
     return False
 
@@ -366,8 +364,7 @@ async def verify_chat_image_deleted_activity(params: Dict[str, Any]) -> bool:
         logger.info("verify_chat_image_deleted_activity: skipped")
         return True
 
-    import docker
-    client = docker.from_env()
+    client = get_docker_client()
 
     tag = params.get("tag", ChatManager.IMAGE)
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import json
 import logging
@@ -233,7 +234,8 @@ async def deploy_to_render_activity(params: Dict[str, Any]) -> Dict[str, Any]:
         ])
     
     try:
-        resp = requests.post(
+        resp = await asyncio.to_thread(
+            requests.post,
             "https://api.render.com/v1/services",
             headers=headers,
             json=payload,
@@ -366,7 +368,8 @@ async def create_neo4j_aura_instance_activity(params: Dict[str, Any]) -> Dict[st
     }
     
     try:
-        resp = requests.post(
+        resp = await asyncio.to_thread(
+            requests.post,
             "https://api.neo4j.io/v1/instances",
             headers=headers,
             json=payload,
@@ -399,8 +402,6 @@ async def create_neo4j_aura_instance_activity(params: Dict[str, Any]) -> Dict[st
 
 @activity.defn
 async def check_deployment_health_activity(params: Dict[str, Any]) -> bool:
-    import time
-    
     url = params.get("url")
     max_attempts = params.get("max_attempts", 30)
     delay = params.get("delay", 10)
@@ -413,7 +414,7 @@ async def check_deployment_health_activity(params: Dict[str, Any]) -> bool:
     
     for attempt in range(1, max_attempts + 1):
         try:
-            resp = requests.get(url, timeout=15)
+            resp = await asyncio.to_thread(requests.get, url, timeout=15)
             if resp.status_code < 400:
                 logger.info("event=health_check_success attempt=%s url=%s", attempt, url)
                 return True
@@ -422,7 +423,7 @@ async def check_deployment_health_activity(params: Dict[str, Any]) -> bool:
             logger.warning("event=health_check_failed attempt=%s error=%s", attempt, str(e)[:100])
         
         if attempt < max_attempts:
-            time.sleep(delay)
+            await asyncio.sleep(delay)
     
     logger.error("event=health_check_timeout url=%s attempts=%s", url, max_attempts)
     return False
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+import queue
 import sys
 from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Sequence, Type
 
@@ -104,10 +106,25 @@ class ChatWorker(BaseWorker):
         ]
 
 
+def start_log_listener() -> QueueListener:
+    # Activities log from the event loop; hand records to a background thread
+    # so stdout writes never block it.
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 async def main():
+    listener = start_log_listener()
     worker = ChatWorker()
     logger.info("ChatWorker starting...")
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
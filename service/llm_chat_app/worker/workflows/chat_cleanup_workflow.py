@@ -16,7 +16,7 @@ class ChatCleanupWorkflow(BaseWorkflow):
             maximum_attempts=3
         )
         timeout = timedelta(minutes=10)
-        logger.info("workflow ChatCleanupWorkflow start params=%s", params)
+        logger.info("workflow ChatCleanupWorkflow start keys=%s", sorted(params))
         await workflow.execute_activity("delete_chat_image_activity", params, start_to_close_timeout=timeout, retry_policy=rp)
         await workflow.execute_activity("verify_chat_image_deleted_activity", params, start_to_close_timeout=timeout, retry_policy=rp)
         await workflow.execute_activity("stop_neo4j_dependency_activity", params, start_to_close_timeout=timeout, retry_policy=rp)
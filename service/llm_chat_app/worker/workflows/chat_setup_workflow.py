@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import timedelta
 from temporalio import workflow
@@ -20,14 +21,29 @@ class ChatSetupWorkflow(BaseWorkflow):
         p = dict(params)
         p["context"] = "/home/j/live/dinesh/llm-chatbot-python/service/llm_chat_app"
 
-        logger.info("workflow ChatSetupWorkflow start params=%s", p)
+        logger.info("workflow ChatSetupWorkflow start keys=%s", sorted(p))
 
-        await workflow.execute_activity(
-            "start_neo4j_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
-        )
-        await workflow.execute_activity(
-            "verify_cloudflare_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
-        )
+        if workflow.patched("parallel-dependencies"):
+            # Neo4j startup and the Cloudflare credential check are independent
+            results = await asyncio.gather(
+                workflow.execute_activity(
+                    "start_neo4j_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
+                ),
+                workflow.execute_activity(
+                    "verify_cloudflare_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        else:
+            await workflow.execute_activity(
+                "start_neo4j_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
+            )
+            await workflow.execute_activity(
+                "verify_cloudflare_dependency_activity", p, start_to_close_timeout=timeout, retry_policy=rp
+            )
         await workflow.execute_activity(
             "build_chat_image_activity", p, start_to_close_timeout=timeout, retry_policy=rp
         )
@@ -23,7 +23,7 @@ class FlyioDeploymentWorkflow(BaseWorkflow):
         p = dict(params)
         p.setdefault("service_name", "flyio-deploy")
 
-        logger.info("workflow FlyioDeploymentWorkflow start params=%s", p)
+        logger.info("workflow FlyioDeploymentWorkflow start keys=%s", sorted(p))
 
         await workflow.execute_activity(
             "generate_deployment_configs_activity",
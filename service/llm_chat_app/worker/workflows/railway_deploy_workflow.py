@@ -23,7 +23,7 @@ class RailwayDeploymentWorkflow(BaseWorkflow):
         p = dict(params)
         p.setdefault("service_name", "railway-deploy")
 
-        logger.info("workflow RailwayDeploymentWorkflow start params=%s", p)
+        logger.info("workflow RailwayDeploymentWorkflow start keys=%s", sorted(p))
 
         await workflow.execute_activity(
             "generate_deployment_configs_activity",
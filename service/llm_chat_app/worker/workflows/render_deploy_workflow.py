@@ -23,7 +23,7 @@ class RenderDeploymentWorkflow(BaseWorkflow):
         p = dict(params)
         p.setdefault("service_name", "render-deploy")
 
-        logger.info("workflow RenderDeploymentWorkflow start params=%s", p)
+        logger.info("workflow RenderDeploymentWorkflow start keys=%s", sorted(p))
 
         await workflow.execute_activity(
             "generate_deployment_configs_activity",